@@ -6,8 +6,15 @@ A two-player Ping Pong game with adjustable AI difficulty, power-ups, and enhanc
 import pygame
 import sys
 import random
-from enum import Enum
-from typing import Tuple, Optional, List
+from math import log, sqrt
+from enum import Enum, IntEnum
+from typing import Tuple, Optional, List, Sequence, Dict
+
+
+def _triangle_table(period: int, base: int, amplitude: int) -> Tuple[int, ...]:
+    """Build a pulse lookup table falling from base + amplitude to base and back over one period."""
+    half = period / 2
+    return tuple(int(base + abs(i - half) / half * amplitude) for i in range(period))
 
 
 # Configuration Constants
@@ -17,6 +24,10 @@ class GameConfig:
     WINDOW_HEIGHT: int = 500
     TITLE: str = "snap pong "
     FPS: int = 60
+    PHYSICS_STEP: float = 1 / FPS  # seconds per fixed physics update
+    MAX_FRAME_TIME: float = 0.25  # cap on catch-up time after a stalled frame
+    VSYNC_PROBE_FRAMES: int = 6  # presents timed at startup to check that vsync really blocks
+    VSYNC_MIN_FRAME_MS: int = 3  # presents faster than this (over ~333 Hz) aren't vblank-paced
     WIN_SCORE: int = 5
     
     # Colors
@@ -35,6 +46,7 @@ class GameConfig:
     DARK_PURPLE: Tuple[int, int, int] = (75, 0, 130)
     ROYAL_BLUE: Tuple[int, int, int] = (65, 105, 225)
     DEEP_PURPLE: Tuple[int, int, int] = (48, 25, 52)
+    MIDNIGHT_BLUE: Tuple[int, int, int] = (30, 50, 150)
     
     # Paddle Configuration
     PADDLE_WIDTH: int = 10
@@ -60,14 +72,53 @@ class GameConfig:
     POWERUP_SIZE: int = 15
     POWERUP_DURATION: int = 180  # frames
     POWERUP_SPEED: int = 2
+    
+    # Partial redraw: every dirty area gets its own clipped pass over the static layers,
+    # so beyond this many areas, or once they cover this many pixels, those passes cost
+    # about as much as repainting the whole screen once
+    MAX_DIRTY_RECTS: int = 8
+    MAX_DIRTY_AREA: int = WINDOW_WIDTH * WINDOW_HEIGHT // 2
+    
+    # Pulse animation lookup tables, one entry per frame of the cycle; the period is a
+    # power of two so the animation counter wraps with a bitmask instead of a modulo
+    PULSE_PERIOD: int = 64
+    PULSE_MASK: int = PULSE_PERIOD - 1
+    PULSE_BRIGHTNESS: Tuple[int, ...] = _triangle_table(PULSE_PERIOD, 200, 55)
+    STAR_SIZES: Tuple[int, ...] = _triangle_table(PULSE_PERIOD, 2, 2)
+    STAR_POSITIONS: Tuple[Tuple[int, int], ...] = (
+        (50, 30), (150, 80), (300, 40), (500, 70), (700, 50),
+        (100, 450), (350, 420), (600, 460), (750, 440),
+        (200, 150), (650, 250), (400, 350),
+    )
+
+
+class PowerUpType(IntEnum):
+    """Power-up types available in the game, numbered for table lookups."""
+    SPEED_BOOST = 0
+    SLOW_AI = 1
+    BIG_PADDLE = 2
+    FAST_BALL = 3
+
+
+# All power-up types, for picking one by random index
+_POWERUP_TYPES: Tuple[PowerUpType, ...] = tuple(PowerUpType)
+
+# Power-up colors indexed by PowerUpType value
+_POWERUP_COLORS: Tuple[Tuple[int, int, int], ...] = (
+    GameConfig.GREEN,   # SPEED_BOOST
+    GameConfig.CYAN,    # SLOW_AI
+    GameConfig.BLUE,    # BIG_PADDLE
+    GameConfig.YELLOW,  # FAST_BALL
+)
 
+# Paddle glow colors indexed by whether a slow-AI power-up is active
+_PADDLE_GLOW_COLORS: Tuple[Tuple[int, int, int], Tuple[int, int, int]] = (GameConfig.GREEN, GameConfig.CYAN)
 
-class PowerUpType(Enum):
-    """Power-up types available in the game."""
-    SPEED_BOOST = "speed"
-    SLOW_AI = "slow_ai"
-    BIG_PADDLE = "big_paddle"
-    FAST_BALL = "fast_ball"
+
+class Player(IntEnum):
+    """Paddle owners, numbered for indexing per-player tables."""
+    LEFT = 0
+    RIGHT = 1
 
 
 class GameState(Enum):
@@ -78,19 +129,101 @@ class GameState(Enum):
     GAME_OVER = "game_over"
 
 
+def _step_ball(
+    x: float, y: float, speed_x: float, speed_y: float,
+    left_x: int, left_y: int, left_w: int, left_h: int,
+    right_x: int, right_y: int, right_w: int, right_h: int,
+    size: int, height: int, max_speed: float
+) -> Tuple[float, float, float, float, int]:
+    """
+    Advance the ball by one frame and resolve wall and paddle bounces.
+    
+    Works on plain numbers only so the per-frame physics avoids Rect and
+    attribute lookups; the caller writes the result back to the ball.
+    Bounces stay as short-circuiting branches: most frames touch no wall or
+    paddle, and in CPython a skipped comparison is cheaper than min/max and
+    sign arithmetic evaluated on every frame.
+    
+    Returns:
+        Tuple: New (x, y, speed_x, speed_y) and the number of paddle hits.
+    """
+    x += speed_x
+    y += speed_y
+    
+    # Clamp ball speed to maximum for stability; compare squared magnitudes
+    # so the square root is only taken on the rare overspeed frame
+    speed_squared = speed_x * speed_x + speed_y * speed_y
+    if speed_squared > max_speed * max_speed:
+        scale = max_speed / sqrt(speed_squared)
+        speed_x *= scale
+        speed_y *= scale
+    
+    # Boundary collision (top/bottom) with proper clamping
+    if y <= 0:
+        y = 0
+        speed_y = abs(speed_y)  # Ensure moving downward
+    elif y + size >= height:
+        y = height - size
+        speed_y = -abs(speed_y)  # Ensure moving upward
+    
+    hits = 0
+    
+    # Left paddle: push the ball out, send it right and add spin from the hit position
+    if (speed_x < 0 and x < left_x + left_w and x + size > left_x
+            and y < left_y + left_h and y + size > left_y):
+        x = left_x + left_w
+        speed_x = abs(speed_x)
+        speed_y += ((y - left_y) / left_h - 0.5) * 2
+        hits += 1
+    
+    # Right paddle: mirror of the left paddle
+    if (speed_x > 0 and x < right_x + right_w and x + size > right_x
+            and y < right_y + right_h and y + size > right_y):
+        x = right_x - size
+        speed_x = -abs(speed_x)
+        speed_y += ((y - right_y) / right_h - 0.5) * 2
+        hits += 1
+    
+    return x, y, speed_x, speed_y, hits
+
+
+def _interpolate(previous: float, current: float, lag: float) -> float:
+    """Step back from the current value toward the previous one; a lag of 0 is exact."""
+    return current - (current - previous) * lag
+
+
 class PowerUp:
     """Represents a power-up in the game."""
     
+    # Fixed attribute layout: faster attribute access in the per-frame update and hit loops
+    __slots__ = ("x", "y", "prev_y", "type", "rect", "collected")
+    
+    # Pre-rendered sprite per power-up type, indexed by PowerUpType value
+    _sprites: List[pygame.Surface] = []
+    
+    @classmethod
+    def load_sprites(cls) -> None:
+        """Render one sprite per power-up type (requires an initialized display)."""
+        size = GameConfig.POWERUP_SIZE
+        cls._sprites = []
+        for color in _POWERUP_COLORS:
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.ellipse(sprite, color, sprite.get_rect())
+            pygame.draw.circle(sprite, GameConfig.WHITE, sprite.get_rect().center, size // 2, 2)
+            cls._sprites.append(sprite.convert_alpha())
+    
     def __init__(self, x: float, y: float, powerup_type: PowerUpType) -> None:
         """Initialize a power-up."""
         self.x = x
         self.y = y
+        self.prev_y = y  # position one physics step earlier, for render interpolation
         self.type = powerup_type
         self.rect = pygame.Rect(x, y, GameConfig.POWERUP_SIZE, GameConfig.POWERUP_SIZE)
         self.collected = False
     
     def update(self) -> None:
         """Update power-up position."""
+        self.prev_y = self.y
         self.y += GameConfig.POWERUP_SPEED
         self.rect.y = self.y
         
@@ -98,20 +231,10 @@ class PowerUp:
         if self.y > GameConfig.WINDOW_HEIGHT:
             self.collected = True
     
-    def get_color(self) -> Tuple[int, int, int]:
-        """Get the color based on power-up type."""
-        colors = {
-            PowerUpType.SPEED_BOOST: GameConfig.GREEN,
-            PowerUpType.SLOW_AI: GameConfig.CYAN,
-            PowerUpType.BIG_PADDLE: GameConfig.BLUE,
-            PowerUpType.FAST_BALL: GameConfig.YELLOW,
-        }
-        return colors.get(self.type, GameConfig.WHITE)
-    
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the power-up."""
-        pygame.draw.ellipse(screen, self.get_color(), self.rect)
-        pygame.draw.circle(screen, GameConfig.WHITE, self.rect.center, GameConfig.POWERUP_SIZE // 2, 2)
+    @property
+    def sprite(self) -> pygame.Surface:
+        """The pre-rendered sprite for this power-up's type."""
+        return self._sprites[self.type]
 
 
 class PingPongGame:
@@ -121,10 +244,24 @@ class PingPongGame:
         """Initialize the Ping Pong game."""
         pygame.init()
         
-        self.screen = pygame.display.set_mode(
-            (GameConfig.WINDOW_WIDTH, GameConfig.WINDOW_HEIGHT)
-        )
+        # Hardware-scaled, double-buffered window; vsync paces presents where the
+        # driver supports it, with clock.tick() in run() as the fallback limiter
+        display_size = (GameConfig.WINDOW_WIDTH, GameConfig.WINDOW_HEIGHT)
+        display_flags = pygame.SCALED | pygame.DOUBLEBUF
+        try:
+            self.screen = pygame.display.set_mode(display_size, display_flags, vsync=1)
+            self._vsync = self._presents_wait_for_vblank()
+        except pygame.error:
+            self.screen = pygame.display.set_mode(display_size, display_flags)
+            self._vsync = False
         pygame.display.set_caption(GameConfig.TITLE)
+        
+        # Discard high-frequency input the game never reads before it reaches the event queue
+        pygame.event.set_blocked([
+            pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+            pygame.FINGERMOTION, pygame.FINGERDOWN, pygame.FINGERUP,
+            pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+        ])
         self.clock = pygame.time.Clock()
         
         # Setup fonts
@@ -135,17 +272,68 @@ class PingPongGame:
         self.small_font = pygame.font.Font(None, 20)
         self.tiny_font = pygame.font.Font(None, 16)
         
+        # Pre-rendered gradient backgrounds (blitted once per frame)
+        self._bg_start = self._make_gradient_surface(GameConfig.DARK_PURPLE, GameConfig.ROYAL_BLUE)
+        self._bg_game = self._make_gradient_surface(GameConfig.DARK_PURPLE, GameConfig.MIDNIGHT_BLUE)
+        
+        # Power-up sprites are shared by every instance
+        PowerUp.load_sprites()
+        
+        # Rendered text surfaces keyed by (text, font, color)
+        self._text_cache = {}
+        self._title_surface = self._make_title_surface()
+        
+        # Dashed center line, drawn once and blitted each frame
+        self._center_line = self._make_center_line()
+        
+        # Ball with its gold ring, blitted each frame instead of drawing two primitives
+        self._ball_sprite = self._make_ball_sprite()
+        
+        # Paddle sprites with any glow outline, keyed by (height, glow color), built on first use
+        self._paddle_cache: Dict[Tuple[int, Optional[Tuple[int, int, int]]], pygame.Surface] = {}
+        
+        # Pre-filled semi-transparent panels and overlays
+        self._title_panel = self._make_panel((GameConfig.WINDOW_WIDTH - 40, 80), GameConfig.GOLD, 30)
+        self._content_panel = self._make_panel((GameConfig.WINDOW_WIDTH - 80, 280), GameConfig.GOLD, 20)
+        self._game_over_panel = self._make_panel((GameConfig.WINDOW_WIDTH, GameConfig.WINDOW_HEIGHT), GameConfig.DEEP_PURPLE, 40)
+        self._stats_panel = self._make_panel((GameConfig.WINDOW_WIDTH - 100, 180), GameConfig.GOLD, 25)
+        self._info_panel = self._make_panel((GameConfig.WINDOW_WIDTH, 55), GameConfig.DARK_PURPLE, 180)
+        self._pause_overlay = self._make_panel((GameConfig.WINDOW_WIDTH, GameConfig.WINDOW_HEIGHT), GameConfig.DEEP_PURPLE, 120)
+        
         # Animation counter
-        self.animation_counter = 0
+        self.animation_counter = 0  # always within 0..PULSE_MASK, used directly as a table index
+        
+        # Areas of moving elements drawn last frame, for partial redraws during play
+        self._prev_dirty_rects: List[pygame.Rect] = [pygame.Rect(0, 0, 0, 0) for _ in range(6)]
+        
+        # Areas of the fixed movers (paddles, ball, scores, rally) this frame, updated in
+        # place every frame; the previous frame's are copied into the list above, which
+        # owns its own rects, so neither list ever aliases the other
+        self._mover_rects = [pygame.Rect(0, 0, 0, 0) for _ in range(6)]
+        self._last_drawn_state: Optional[GameState] = None
+        
+        # Set on every play frame, and on menu or pause frames when something visible may
+        # have changed; frames without it aren't redrawn
+        self._dirty = True
         
-        # Initialize ball speeds
+        # Initialize ball speeds and sub-pixel position (the Rect only holds whole pixels)
         self.ball_speed_x = 0
         self.ball_speed_y = 0
+        self.ball_x = 0.0
+        self.ball_y = 0.0
+        
+        # Ball and paddle positions one physics step earlier, and how far the render falls
+        # between those and the current step (0-1); drawing interpolates to hide step aliasing
+        self._prev_ball_x = 0.0
+        self._prev_ball_y = 0.0
+        self._render_alpha = 1.0
         
         # Initialize game objects
         self.left_paddle = self._create_left_paddle()
         self.right_paddle = self._create_right_paddle()
         self.ball = self._create_ball()
+        self._prev_left_y = self.left_paddle.y
+        self._prev_right_y = self.right_paddle.y
         
         # Game state
         self.state = GameState.START_SCREEN
@@ -158,7 +346,9 @@ class PingPongGame:
         
         # Power-ups
         self.powerups: List[PowerUp] = []
-        self.active_powerups = {}  # {player: {type: frames_remaining}}
+        # Frames remaining per power-up, indexed [player][powerup type]; 0 means inactive
+        self.active_powerups: List[List[int]] = [[0] * len(PowerUpType) for _ in Player]
+        self._frames_until_spawn = self._roll_spawn_delay()
         
         # Statistics
         self.rally_count = 0
@@ -166,6 +356,106 @@ class PingPongGame:
         self.left_rallies_won = 0
         self.right_rallies_won = 0
     
+    @staticmethod
+    def _make_gradient_surface(top: Tuple[int, int, int], bottom: Tuple[int, int, int]) -> pygame.Surface:
+        """Render a vertical gradient from top to bottom color into a screen-sized surface."""
+        height = GameConfig.WINDOW_HEIGHT
+        # One byte per row for each channel, interleaved into a 1-pixel-wide RGB column
+        channels = [
+            bytes(int(start + (end - start) * (y / height)) for y in range(height))
+            for start, end in zip(top, bottom)
+        ]
+        pixels = bytes(value for row in zip(*channels) for value in row)
+        column = pygame.image.frombuffer(pixels, (1, height), "RGB")
+        # Stretch the column across the window in a single C-level scale
+        return pygame.transform.scale(column, (GameConfig.WINDOW_WIDTH, height)).convert()
+    
+    def _render(self, text: str, font: pygame.font.Font, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render anti-aliased text, reusing the surface from earlier frames when possible."""
+        key = (text, font, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Match the display's pixel format once so later blits skip per-pixel conversion
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
+    
+    def _make_title_surface(self) -> pygame.Surface:
+        """Composite the start screen title and its offset glow layers into one surface."""
+        title = self.title_font.render(GameConfig.TITLE.strip(), True, GameConfig.GOLD)
+        glow_color = (int(GameConfig.DARK_PURPLE[0] * 0.5),
+                      int(GameConfig.DARK_PURPLE[1] * 0.5),
+                      int(GameConfig.DARK_PURPLE[2] * 0.8))
+        glow_text = self.title_font.render(GameConfig.TITLE.strip(), True, glow_color)
+        
+        # Glow layers sit 1-3px right of and 2px below the title
+        surface = pygame.Surface((title.get_width() + 3, title.get_height() + 2), pygame.SRCALPHA)
+        for offset in [3, 2, 1]:
+            surface.blit(glow_text, (offset, 2))
+        surface.blit(title, (0, 0))
+        return surface.convert_alpha()
+    
+    @staticmethod
+    def _presents_wait_for_vblank() -> bool:
+        """
+        Check whether presents actually block until vblank.
+        
+        set_mode() accepting vsync=1 doesn't guarantee it: some drivers only warn
+        and present immediately. Time a few presents of the blank window instead.
+        """
+        pygame.display.flip()  # the first present can include one-off setup
+        start = pygame.time.get_ticks()
+        for _ in range(GameConfig.VSYNC_PROBE_FRAMES):
+            pygame.display.flip()
+        elapsed = pygame.time.get_ticks() - start
+        return elapsed >= GameConfig.VSYNC_PROBE_FRAMES * GameConfig.VSYNC_MIN_FRAME_MS
+    
+    @staticmethod
+    def _make_center_line() -> pygame.Surface:
+        """Draw the dashed gold center line onto a 2px-wide transparent strip."""
+        surface = pygame.Surface((2, GameConfig.WINDOW_HEIGHT), pygame.SRCALPHA)
+        dash_height = 10
+        gap_height = 5
+        y = 0
+        while y < GameConfig.WINDOW_HEIGHT:
+            pygame.draw.line(surface, GameConfig.GOLD, (0, y), (0, y + dash_height), 2)
+            y += dash_height + gap_height
+        return surface.convert_alpha()
+    
+    @staticmethod
+    def _make_ball_sprite() -> pygame.Surface:
+        """Draw the ball and its gold ring onto a transparent surface with a 3px margin."""
+        size = GameConfig.BALL_SIZE
+        surface = pygame.Surface((size + 6, size + 6), pygame.SRCALPHA)
+        ball = pygame.Rect(3, 3, size, size)
+        pygame.draw.ellipse(surface, GameConfig.WHITE, ball)
+        pygame.draw.circle(surface, GameConfig.GOLD, ball.center, size // 2 + 2, 2)
+        return surface.convert_alpha()
+    
+    def _paddle_surface(self, height: int, glow_color: Optional[Tuple[int, int, int]]) -> pygame.Surface:
+        """Get the paddle sprite for a height and glow color, with a 2px margin for the glow."""
+        key = (height, glow_color)
+        surface = self._paddle_cache.get(key)
+        if surface is None:
+            surface = pygame.Surface((GameConfig.PADDLE_WIDTH + 4, height + 4), pygame.SRCALPHA)
+            paddle = pygame.Rect(2, 2, GameConfig.PADDLE_WIDTH, height)
+            pygame.draw.rect(surface, GameConfig.WHITE, paddle)
+            pygame.draw.rect(surface, GameConfig.CYAN, paddle, 2)
+            if glow_color is not None:
+                pygame.draw.rect(surface, glow_color, paddle, 4)
+                pygame.draw.rect(surface, glow_color, surface.get_rect(), 1)
+            surface = surface.convert_alpha()
+            self._paddle_cache[key] = surface
+        return surface
+    
+    @staticmethod
+    def _make_panel(size: Tuple[int, int], color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+        """Create a solid panel surface blended with the given alpha when blitted."""
+        panel = pygame.Surface(size).convert()
+        panel.fill(color)
+        panel.set_alpha(alpha)
+        return panel
+    
     @staticmethod
     def _create_left_paddle() -> pygame.Rect:
         """Create the left player paddle."""
@@ -196,6 +486,8 @@ class PingPongGame:
         )
         self.ball_speed_x = random.choice([-GameConfig.BALL_INITIAL_SPEED, GameConfig.BALL_INITIAL_SPEED])
         self.ball_speed_y = random.choice([-GameConfig.BALL_INITIAL_SPEED, GameConfig.BALL_INITIAL_SPEED])
+        self.ball_x = self._prev_ball_x = float(ball.x)
+        self.ball_y = self._prev_ball_y = float(ball.y)
         return ball
     
     def reset_ball(self) -> None:
@@ -204,6 +496,9 @@ class PingPongGame:
             GameConfig.WINDOW_WIDTH // 2,
             GameConfig.WINDOW_HEIGHT // 2
         )
+        # Teleport: no interpolation from the old position
+        self.ball_x = self._prev_ball_x = float(self.ball.x)
+        self.ball_y = self._prev_ball_y = float(self.ball.y)
         self.ball_speed_x = random.choice([-GameConfig.BALL_INITIAL_SPEED, GameConfig.BALL_INITIAL_SPEED])
         self.ball_speed_y = random.choice([-GameConfig.BALL_INITIAL_SPEED, GameConfig.BALL_INITIAL_SPEED])
     
@@ -216,22 +511,38 @@ class PingPongGame:
         self.left_rallies_won = 0
         self.right_rallies_won = 0
         self.powerups.clear()
-        self.active_powerups.clear()
+        self.active_powerups = [[0] * len(PowerUpType) for _ in Player]
+        self._frames_until_spawn = self._roll_spawn_delay()
         self.reset_ball()
+        self._prev_left_y = self.left_paddle.y
+        self._prev_right_y = self.right_paddle.y
         self.state = GameState.PLAYING
     
-    def handle_events(self) -> bool:
+    def handle_events(self, first_event: Optional[pygame.event.Event] = None) -> bool:
         """
         Handle input events.
         
+        Args:
+            first_event: An event already taken off the queue by a blocking wait
+        
         Returns:
             bool: False if the game should quit, True otherwise.
         """
-        for event in pygame.event.get():
+        # Drain the whole queue in one batch; the caller has already pumped this frame
+        events = pygame.event.get(pump=False)
+        if first_event is not None:
+            events.insert(0, first_event)
+        
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
             
+            # The window contents were lost (e.g. uncovered) and must be repainted
+            if event.type == pygame.WINDOWEXPOSED:
+                self._dirty = True
+            
             if event.type == pygame.KEYDOWN:
+                self._dirty = True
                 if event.key == pygame.K_ESCAPE:
                     return False
                 
@@ -279,63 +590,77 @@ class PingPongGame:
         
         return True
     
-    def move_player(self) -> None:
-        """Move the left player paddle based on input."""
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_w] and self.left_paddle.top > 0:
-            self.left_paddle.y -= GameConfig.PADDLE_SPEED
-        if keys[pygame.K_s] and self.left_paddle.bottom < GameConfig.WINDOW_HEIGHT:
-            self.left_paddle.y += GameConfig.PADDLE_SPEED
+    def move_player(self, keys: Sequence[bool]) -> None:
+        """Move the left player paddle based on the current key snapshot."""
+        paddle = self.left_paddle
+        
+        # Key states are 0/1, so the step and the screen clamp need no branches
+        step = GameConfig.PADDLE_SPEED * (keys[pygame.K_s] - keys[pygame.K_w])
+        max_y = GameConfig.WINDOW_HEIGHT - paddle.height
+        paddle.y = min(max(0, paddle.y + step), max_y)
     
-    def move_right_player(self) -> None:
+    def move_right_player(self, keys: Sequence[bool]) -> None:
         """Move the right player paddle (for two-player mode)."""
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_UP] and self.right_paddle.top > 0:
-            self.right_paddle.y -= GameConfig.PADDLE_SPEED
-        if keys[pygame.K_DOWN] and self.right_paddle.bottom < GameConfig.WINDOW_HEIGHT:
-            self.right_paddle.y += GameConfig.PADDLE_SPEED
+        paddle = self.right_paddle
+        step = GameConfig.PADDLE_SPEED * (keys[pygame.K_DOWN] - keys[pygame.K_UP])
+        max_y = GameConfig.WINDOW_HEIGHT - paddle.height
+        paddle.y = min(max(0, paddle.y + step), max_y)
     
     def move_ai(self) -> None:
         """Move the right AI paddle to follow the ball."""
-        paddle_center = self.right_paddle.y + self.right_paddle.height // 2
-        ball_center = self.ball.y + self.ball.height // 2
+        paddle = self.right_paddle
+        
+        # Rect.centery is y + height // 2, computed in C
+        paddle_center = paddle.centery
+        ball_center = self.ball.centery
         
         # Apply slow AI power-up if active
         current_speed = self.ai_speed
-        if "right" in self.active_powerups and PowerUpType.SLOW_AI in self.active_powerups["right"]:
+        if self.active_powerups[Player.RIGHT][PowerUpType.SLOW_AI]:
             current_speed = max(1, current_speed // 2)
         
-        if paddle_center < ball_center and self.right_paddle.bottom < GameConfig.WINDOW_HEIGHT:
-            self.right_paddle.y += current_speed
-        elif paddle_center > ball_center and self.right_paddle.top > 0:
-            self.right_paddle.y -= current_speed
+        # Step toward the ball (+1 down, -1 up, 0 when level) and clamp to the screen
+        direction = (paddle_center < ball_center) - (paddle_center > ball_center)
+        max_y = GameConfig.WINDOW_HEIGHT - paddle.height
+        paddle.y = min(max(0, paddle.y + direction * current_speed), max_y)
+    
+    @staticmethod
+    def _roll_spawn_delay() -> int:
+        """
+        Draw the number of frames until the next power-up spawn.
+        
+        Flooring an exponential with rate -ln(1 - p) gives the same geometric
+        distribution as rolling POWERUP_SPAWN_CHANCE once per frame, but costs
+        one random draw per spawn instead of one per frame.
+        """
+        rate = -log(1 - GameConfig.POWERUP_SPAWN_CHANCE)
+        return 1 + int(random.expovariate(rate))
     
     def spawn_powerup(self) -> None:
         """Randomly spawn a power-up near the ball."""
-        if random.random() < GameConfig.POWERUP_SPAWN_CHANCE:
-            powerup_type = random.choice(list(PowerUpType))
+        self._frames_until_spawn -= 1
+        if self._frames_until_spawn <= 0:
+            self._frames_until_spawn = self._roll_spawn_delay()
+            powerup_type = _POWERUP_TYPES[random.randrange(len(_POWERUP_TYPES))]
             self.powerups.append(
                 PowerUp(self.ball.x, self.ball.y, powerup_type)
             )
     
-    def activate_powerup(self, player: str, powerup: PowerUp) -> None:
+    def activate_powerup(self, player: Player, powerup: PowerUp) -> None:
         """Activate a power-up for a player."""
-        if player not in self.active_powerups:
-            self.active_powerups[player] = {}
-        
         if powerup.type == PowerUpType.SPEED_BOOST:
-            if player == "left":
+            if player == Player.LEFT:
                 self.left_paddle.height = min(GameConfig.PADDLE_HEIGHT + 30, int(GameConfig.PADDLE_HEIGHT * 1.5))
             else:
                 self.right_paddle.height = min(GameConfig.PADDLE_HEIGHT + 30, int(GameConfig.PADDLE_HEIGHT * 1.5))
         
         elif powerup.type == PowerUpType.BIG_PADDLE:
-            if player == "left":
+            if player == Player.LEFT:
                 self.left_paddle.height = int(GameConfig.PADDLE_HEIGHT * 1.3)
             else:
                 self.right_paddle.height = int(GameConfig.PADDLE_HEIGHT * 1.3)
         
-        elif powerup.type == PowerUpType.SLOW_AI and player == "left":
+        elif powerup.type == PowerUpType.SLOW_AI and player == Player.LEFT:
             pass  # Slows the AI
         
         elif powerup.type == PowerUpType.FAST_BALL:
@@ -346,86 +671,64 @@ class PingPongGame:
     
     def update_powerups(self) -> None:
         """Update active power-ups and remove expired ones."""
-        for player in self.active_powerups:
-            expired = []
-            for powerup_type, frames in self.active_powerups[player].items():
-                self.active_powerups[player][powerup_type] -= 1
-                if self.active_powerups[player][powerup_type] <= 0:
-                    expired.append(powerup_type)
-            
-            for powerup_type in expired:
-                del self.active_powerups[player][powerup_type]
+        for player, timers in enumerate(self.active_powerups):
+            # Most steps have no power-up running; any() skips the per-slot loop in C
+            if not any(timers):
+                continue
+            for powerup_type, frames in enumerate(timers):
+                if frames == 0:
+                    continue
+                timers[powerup_type] = frames - 1
                 
-                # Revert paddle size
-                if powerup_type in [PowerUpType.SPEED_BOOST, PowerUpType.BIG_PADDLE]:
-                    if player == "left":
+                # Revert paddle size on the frame a size power-up expires
+                if frames == 1 and powerup_type in (PowerUpType.SPEED_BOOST, PowerUpType.BIG_PADDLE):
+                    if player == Player.LEFT:
                         self.left_paddle.height = GameConfig.PADDLE_HEIGHT
                     else:
                         self.right_paddle.height = GameConfig.PADDLE_HEIGHT
         
-        # Update power-up positions
-        for powerup in self.powerups[:]:
-            powerup.update()
-            if powerup.collected:
-                self.powerups.remove(powerup)
+        # Update power-up positions, then drop collected ones in a single pass
+        powerups = self.powerups
+        if powerups:
+            for powerup in powerups:
+                powerup.update()
+            self.powerups = [powerup for powerup in powerups if not powerup.collected]
     
     def update_ball(self) -> None:
         """Update ball position and handle collisions."""
-        self.ball.x += self.ball_speed_x
-        self.ball.y += self.ball_speed_y
-        
-        # Clamp ball speed to maximum for stability
-        speed_magnitude = (self.ball_speed_x ** 2 + self.ball_speed_y ** 2) ** 0.5
-        if speed_magnitude > GameConfig.MAX_BALL_SPEED:
-            scale = GameConfig.MAX_BALL_SPEED / speed_magnitude
-            self.ball_speed_x *= scale
-            self.ball_speed_y *= scale
-        
-        # Boundary collision (top/bottom) with proper clamping
-        if self.ball.top <= 0:
-            self.ball.top = 0
-            self.ball_speed_y = abs(self.ball_speed_y)  # Ensure moving downward
-        elif self.ball.bottom >= GameConfig.WINDOW_HEIGHT:
-            self.ball.bottom = GameConfig.WINDOW_HEIGHT
-            self.ball_speed_y = -abs(self.ball_speed_y)  # Ensure moving upward
-        
-        # Paddle collisions with improved detection
-        left_collision = self.ball.colliderect(self.left_paddle) and self.ball_speed_x < 0
-        if left_collision:
-            # Ensure ball is pushed out of paddle
-            self.ball.left = self.left_paddle.right
-            self.ball_speed_x = abs(self.ball_speed_x)  # Ensure moving right
-            # Add spin based on where ball hit paddle
-            hit_pos = (self.ball.y - self.left_paddle.y) / self.left_paddle.height
-            self.ball_speed_y += (hit_pos - 0.5) * 2
-            self.rally_count += 1
-        
-        right_collision = self.ball.colliderect(self.right_paddle) and self.ball_speed_x > 0
-        if right_collision:
-            # Ensure ball is pushed out of paddle
-            self.ball.right = self.right_paddle.left
-            self.ball_speed_x = -abs(self.ball_speed_x)  # Ensure moving left
-            # Add spin based on where ball hit paddle
-            hit_pos = (self.ball.y - self.right_paddle.y) / self.right_paddle.height
-            self.ball_speed_y += (hit_pos - 0.5) * 2
-            self.rally_count += 1
-        
-        # Power-up collision detection
-        for powerup in self.powerups:
-            if self.ball.colliderect(powerup.rect):
-                player = "left" if self.ball_speed_x < 0 else "right"
+        ball = self.ball
+        x = self._prev_ball_x = self.ball_x
+        y = self._prev_ball_y = self.ball_y
+        x, y, self.ball_speed_x, self.ball_speed_y, hits = _step_ball(
+            x, y, self.ball_speed_x, self.ball_speed_y,
+            *self.left_paddle, *self.right_paddle,
+            GameConfig.BALL_SIZE, GameConfig.WINDOW_HEIGHT, GameConfig.MAX_BALL_SPEED
+        )
+        # Sync the pixel Rect used for drawing and power-up/score checks
+        self.ball_x = ball.x = x
+        self.ball_y = ball.y = y
+        self.rally_count += hits
+        
+        # Power-up collision detection: test all power-up rects in one C-level
+        # call and only visit the ones that were actually hit
+        powerups = self.powerups
+        if powerups:
+            hit_indices = ball.collidelistall([powerup.rect for powerup in powerups])
+            for index in hit_indices:
+                powerup = powerups[index]
+                player = Player.LEFT if self.ball_speed_x < 0 else Player.RIGHT
                 self.activate_powerup(player, powerup)
                 powerup.collected = True
         
         # Score updates
-        if self.ball.left <= 0:
+        if ball.left <= 0:
             self.right_score += 1
             self.longest_rally = max(self.longest_rally, self.rally_count)
             self.right_rallies_won += 1
             self.rally_count = 0
             self.reset_ball()
         
-        if self.ball.right >= GameConfig.WINDOW_WIDTH:
+        if ball.right >= GameConfig.WINDOW_WIDTH:
             self.left_score += 1
             self.longest_rally = max(self.longest_rally, self.rally_count)
             self.left_rallies_won += 1
@@ -443,34 +746,19 @@ class PingPongGame:
         
         # Draw semi-transparent panels for better text readability
         # Top title panel
-        title_panel = pygame.Surface((GameConfig.WINDOW_WIDTH - 40, 80))
-        title_panel.set_alpha(30)
-        title_panel.fill(GameConfig.GOLD)
-        self.screen.blit(title_panel, (20, 10))
+        self.screen.blit(self._title_panel, (20, 10))
         
         # Middle content panel
-        content_panel = pygame.Surface((GameConfig.WINDOW_WIDTH - 80, 280))
-        content_panel.set_alpha(20)
-        content_panel.fill(GameConfig.GOLD)
-        self.screen.blit(content_panel, (40, 105))
-        
-        # Title with glow effect
-        title = self.title_font.render(GameConfig.TITLE.strip(), True, GameConfig.GOLD)
+        self.screen.blit(self._content_panel, (40, 105))
         
-        # Draw multiple text layers for glow effect
-        for offset in [3, 2, 1]:
-            glow_text = self.title_font.render(GameConfig.TITLE.strip(), True, 
-                                               (int(GameConfig.DARK_PURPLE[0] * 0.5), 
-                                                int(GameConfig.DARK_PURPLE[1] * 0.5), 
-                                                int(GameConfig.DARK_PURPLE[2] * 0.8)))
-            self.screen.blit(glow_text, (GameConfig.WINDOW_WIDTH // 2 - title.get_width() // 2 + offset, 22))
-        
-        self.screen.blit(title, (GameConfig.WINDOW_WIDTH // 2 - title.get_width() // 2, 20))
+        # Title with glow effect (pre-composited)
+        title_width = self._title_surface.get_width() - 3
+        self.screen.blit(self._title_surface, (GameConfig.WINDOW_WIDTH // 2 - title_width // 2, 20))
         
         # Current selections
-        mode_text = "🎮 1 Player vs AI" if not self.is_two_player else "👥 2 Players"
-        difficulty_names = {1: "⚡ EASY", 2: "⚡⚡ MEDIUM", 3: "⚡⚡⚡ HARD"}
-        difficulty_text = difficulty_names.get(self.current_difficulty, "⚡⚡ MEDIUM")
+        mode_text = "1 Player vs AI" if not self.is_two_player else "2 Players"
+        difficulty_names = {1: "EASY", 2: "MEDIUM", 3: "HARD"}
+        difficulty_text = difficulty_names.get(self.current_difficulty, "MEDIUM")
         
         # Draw selection info
         selections = [
@@ -483,18 +771,18 @@ class PingPongGame:
         ]
         
         for text, color, font, y in selections:
-            txt = font.render(text, True, color)
+            txt = self._render(text, font, color)
             self.screen.blit(txt, (GameConfig.WINDOW_WIDTH // 2 - txt.get_width() // 2, y))
         
         # How to play section
         instructions = [
-            ("⌨️ LEFT: W/S  •  RIGHT: ↑/↓", GameConfig.WHITE, self.small_font, 355),
-            ("⭐ Power-ups appear during play ⭐", GameConfig.GOLD, self.small_font, 380),
-            ("🏆 First to reach the goal wins!", GameConfig.WHITE, self.small_font, 405),
+            ("LEFT: W/S  •  RIGHT: UP/DOWN", GameConfig.WHITE, self.small_font, 355),
+            ("* Power-ups appear during play *", GameConfig.GOLD, self.small_font, 380),
+            ("First to reach the goal wins!", GameConfig.WHITE, self.small_font, 405),
         ]
         
         for text, color, font, y in instructions:
-            txt = font.render(text, True, color)
+            txt = self._render(text, font, color)
             self.screen.blit(txt, (GameConfig.WINDOW_WIDTH // 2 - txt.get_width() // 2, y))
         
         # Start button with animation
@@ -504,8 +792,7 @@ class PingPongGame:
         button_y = 440
         
         # Pulsing button effect
-        pulse = abs(((self.animation_counter) % 60) - 30) / 30.0
-        button_brightness = int(200 + pulse * 55)
+        button_brightness = GameConfig.PULSE_BRIGHTNESS[self.animation_counter]
         
         # Draw button background with rounded appearance
         pygame.draw.rect(self.screen, (button_brightness, int(button_brightness * 0.8), 0), 
@@ -513,7 +800,7 @@ class PingPongGame:
         pygame.draw.rect(self.screen, GameConfig.GOLD, 
                         (button_x, button_y, button_width, button_height), 2, border_radius=8)
         
-        start_txt = self.text_font.render("▶ PRESS SPACE TO START ◀", True, GameConfig.DEEP_PURPLE)
+        start_txt = self._render("PRESS SPACE TO START", self.text_font, GameConfig.DEEP_PURPLE)
         self.screen.blit(start_txt, (GameConfig.WINDOW_WIDTH // 2 - start_txt.get_width() // 2, 448))
     
     def draw_game_over(self) -> None:
@@ -522,29 +809,24 @@ class PingPongGame:
         self._draw_royal_background()
         
         # Draw semi-transparent panel
-        panel = pygame.Surface((GameConfig.WINDOW_WIDTH, GameConfig.WINDOW_HEIGHT))
-        panel.set_alpha(40)
-        panel.fill(GameConfig.DEEP_PURPLE)
-        self.screen.blit(panel, (0, 0))
+        self.screen.blit(self._game_over_panel, (0, 0))
         
         winner = "Player 1" if self.left_score > self.right_score else ("AI" if not self.is_two_player else "Player 2")
         
         # Winner announcement with glow effect
-        for offset in [4, 2]:
-            winner_glow = self.big_font.render(f"👑 {winner.upper()} WINS! 👑", True, 
-                                              (int(GameConfig.DARK_PURPLE[0] * 0.7), 
-                                               int(GameConfig.DARK_PURPLE[1] * 0.7), 
-                                               int(GameConfig.DARK_PURPLE[2] * 0.9)))
-            self.screen.blit(winner_glow, (GameConfig.WINDOW_WIDTH // 2 - 150 + offset, 60 + offset))
+        winner_glow = self._render(f"{winner.upper()} WINS!", self.big_font,
+                                   (int(GameConfig.DARK_PURPLE[0] * 0.7), 
+                                    int(GameConfig.DARK_PURPLE[1] * 0.7), 
+                                    int(GameConfig.DARK_PURPLE[2] * 0.9)))
+        winner_text = self._render(f"{winner.upper()} WINS!", self.big_font, GameConfig.GOLD)
+        winner_x = GameConfig.WINDOW_WIDTH // 2 - winner_text.get_width() // 2
         
-        winner_text = self.big_font.render(f"👑 {winner.upper()} WINS! 👑", True, GameConfig.GOLD)
-        self.screen.blit(winner_text, (GameConfig.WINDOW_WIDTH // 2 - 150, 60))
+        for offset in [4, 2]:
+            self.screen.blit(winner_glow, (winner_x + offset, 60 + offset))
+        self.screen.blit(winner_text, (winner_x, 60))
         
         # Statistics panel with semi-transparency
-        stats_panel = pygame.Surface((GameConfig.WINDOW_WIDTH - 100, 180))
-        stats_panel.set_alpha(25)
-        stats_panel.fill(GameConfig.GOLD)
-        self.screen.blit(stats_panel, (50, 160))
+        self.screen.blit(self._stats_panel, (50, 160))
         
         stats = [
             f"Final Score: {self.left_score} - {self.right_score}",
@@ -554,7 +836,7 @@ class PingPongGame:
         
         y = 180
         for stat in stats:
-            txt = self.text_font.render(stat, True, GameConfig.WHITE)
+            txt = self._render(stat, self.text_font, GameConfig.WHITE)
             self.screen.blit(txt, (GameConfig.WINDOW_WIDTH // 2 - txt.get_width() // 2, y))
             y += 45
         
@@ -565,159 +847,300 @@ class PingPongGame:
         button_y = 410
         
         # Pulsing button effect
-        pulse = abs(((self.animation_counter) % 60) - 30) / 30.0
-        button_brightness = int(200 + pulse * 55)
+        button_brightness = GameConfig.PULSE_BRIGHTNESS[self.animation_counter]
         
         pygame.draw.rect(self.screen, (button_brightness, int(button_brightness * 0.8), 0), 
                         (button_x, button_y, button_width, button_height), border_radius=10)
         pygame.draw.rect(self.screen, GameConfig.GOLD, 
                         (button_x, button_y, button_width, button_height), 2, border_radius=10)
         
-        restart_txt = self.text_font.render("PRESS SPACE TO RESTART", True, GameConfig.DEEP_PURPLE)
+        restart_txt = self._render("PRESS SPACE TO RESTART", self.text_font, GameConfig.DEEP_PURPLE)
         self.screen.blit(restart_txt, (GameConfig.WINDOW_WIDTH // 2 - restart_txt.get_width() // 2, 422))
     
-    def draw_game(self) -> None:
-        """Draw the active game state."""
+    def draw_game(self, full_redraw: bool = True) -> None:
+        """
+        Draw the active game state.
+        
+        Args:
+            full_redraw: Repaint the whole screen. Otherwise only the areas where moving
+                elements were last frame or are now get repainted, on top of the previous frame.
+        """
+        left_paddle, right_paddle, ball, powerup_rects = self._interpolated_rects()
+        texts = self._info_bar_texts()
+        moving_rects = self._moving_rects(left_paddle, right_paddle, ball, powerup_rects, texts)
+        dirty_rects = []
+        if not full_redraw:
+            dirty_rects = self._merge_rects(self._prev_dirty_rects + moving_rects)
+            if (len(dirty_rects) > GameConfig.MAX_DIRTY_RECTS
+                    or sum(rect.w * rect.h for rect in dirty_rects) > GameConfig.MAX_DIRTY_AREA):
+                dirty_rects = []  # too many or too large to be worth tracking
+        
+        # Keep this frame's areas for the next one: copy the movers into the owned rects
+        # and swap in this frame's power-up rects, which are fresh copies
+        prev_rects = self._prev_dirty_rects
+        for prev_rect, rect in zip(prev_rects, self._mover_rects):
+            prev_rect.update(rect)
+        prev_rects[len(self._mover_rects):] = powerup_rects
+        
+        # Static layers are clipped to the dirty areas, which always contain every moving
+        # element, so those draw unclipped; a None region means the whole screen
+        regions = dirty_rects or [None]
+        
         # Draw royal game background
-        self._draw_royal_game_background()
+        for region in regions:
+            self.screen.set_clip(region)
+            self._draw_royal_game_background()
+        self.screen.set_clip(None)
         
         # Draw paddles with glow effect if powered up
-        self._draw_paddle(self.left_paddle, "left")
-        self._draw_paddle(self.right_paddle, "right")
+        self._draw_paddle(left_paddle, Player.LEFT)
+        self._draw_paddle(right_paddle, Player.RIGHT)
         
         # Draw ball with glow
-        pygame.draw.ellipse(self.screen, GameConfig.WHITE, self.ball)
-        pygame.draw.circle(self.screen, GameConfig.GOLD, self.ball.center, GameConfig.BALL_SIZE // 2 + 2, 2)
-        
-        # Draw center line (dashed effect) in gold
-        dash_height = 10
-        gap_height = 5
-        y = 0
-        while y < GameConfig.WINDOW_HEIGHT:
-            pygame.draw.line(
-                self.screen,
-                GameConfig.GOLD,
-                (GameConfig.WINDOW_WIDTH // 2, y),
-                (GameConfig.WINDOW_WIDTH // 2, y + dash_height),
-                2
-            )
-            y += dash_height + gap_height
-        
-        # Draw top info bar with gradient panel
-        info_panel = pygame.Surface((GameConfig.WINDOW_WIDTH, 55))
-        info_panel.set_alpha(180)
-        info_panel.fill(GameConfig.DARK_PURPLE)
-        self.screen.blit(info_panel, (0, 0))
+        self.screen.blit(self._ball_sprite, (ball.x - 3, ball.y - 3))
         
-        # Draw scores
-        left_score_text = self.score_font.render(str(self.left_score), True, GameConfig.GOLD)
-        right_score_text = self.score_font.render(str(self.right_score), True, GameConfig.GOLD)
-        
-        self.screen.blit(left_score_text, (30, 5))
-        self.screen.blit(right_score_text, (GameConfig.WINDOW_WIDTH - 60, 5))
+        for region in regions:
+            self.screen.set_clip(region)
+            
+            # Draw center line (dashed effect) in gold
+            self.screen.blit(self._center_line, (GameConfig.WINDOW_WIDTH // 2, 0))
+            
+            # Draw top info bar with gradient panel
+            self.screen.blit(self._info_panel, (0, 0))
+        self.screen.set_clip(None)
         
-        # Draw rally count in center with icon
-        rally_text = self.text_font.render(f"🔥 Rally: {self.rally_count}", True, GameConfig.GOLD)
-        self.screen.blit(rally_text, (GameConfig.WINDOW_WIDTH // 2 - rally_text.get_width() // 2, 10))
-        
-        # Draw power-ups
-        for powerup in self.powerups:
-            powerup.draw(self.screen)
+        # Draw scores and rally count, then power-ups, composited in one batched call
+        powerup_sprites = [(powerup.sprite, rect) for powerup, rect in zip(self.powerups, powerup_rects)]
+        self.screen.blits(texts + powerup_sprites, doreturn=False)
         
         # Draw pause indicator with semi-transparent background
         if self.state == GameState.PAUSED:
             # Semi-transparent overlay
-            overlay = pygame.Surface((GameConfig.WINDOW_WIDTH, GameConfig.WINDOW_HEIGHT))
-            overlay.set_alpha(120)
-            overlay.fill(GameConfig.DEEP_PURPLE)
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self._pause_overlay, (0, 0))
             
-            pause_text = self.title_font.render("⏸ PAUSED ⏸", True, GameConfig.GOLD)
-            resume_text = self.text_font.render("Press SPACE to Resume", True, GameConfig.WHITE)
+            pause_text = self._render("PAUSED", self.title_font, GameConfig.GOLD)
+            resume_text = self._render("Press SPACE to Resume", self.text_font, GameConfig.WHITE)
             
             self.screen.blit(pause_text, (GameConfig.WINDOW_WIDTH // 2 - pause_text.get_width() // 2, 180))
             self.screen.blit(resume_text, (GameConfig.WINDOW_WIDTH // 2 - resume_text.get_width() // 2, 280))
     
+    def _info_bar_texts(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Get the score and rally text surfaces with their positions in the info bar."""
+        # Cached per value, so only re-rendered when a point is scored or the rally grows
+        left_score_text = self._render(str(self.left_score), self.score_font, GameConfig.GOLD)
+        right_score_text = self._render(str(self.right_score), self.score_font, GameConfig.GOLD)
+        
+        # Rally count in center: label and number are separate cached surfaces
+        rally_label = self._render("Rally: ", self.text_font, GameConfig.GOLD)
+        rally_value = self._render(str(self.rally_count), self.text_font, GameConfig.GOLD)
+        rally_x = GameConfig.WINDOW_WIDTH // 2 - (rally_label.get_width() + rally_value.get_width()) // 2
+        
+        return [
+            (left_score_text, (30, 5)),
+            (right_score_text, (GameConfig.WINDOW_WIDTH - 60, 5)),
+            (rally_label, (rally_x, 10)),
+            (rally_value, (rally_x + rally_label.get_width(), 10)),
+        ]
+    
+    def _interpolated_rects(self) -> Tuple[pygame.Rect, pygame.Rect, pygame.Rect, List[pygame.Rect]]:
+        """
+        Get where to draw the paddles, ball and power-ups.
+        
+        Every moving element is interpolated between the last two physics steps by
+        the same amount, so the ball stays level with the paddles it bounces off.
+        
+        Returns:
+            Tuple: Left paddle, right paddle and ball rects, and one rect per power-up.
+        """
+        lag = 1.0 - self._render_alpha
+        left_paddle = self.left_paddle.copy()
+        left_paddle.y = _interpolate(self._prev_left_y, left_paddle.y, lag)
+        right_paddle = self.right_paddle.copy()
+        right_paddle.y = _interpolate(self._prev_right_y, right_paddle.y, lag)
+        
+        ball = self.ball.copy()
+        ball.x = _interpolate(self._prev_ball_x, self.ball_x, lag)
+        ball.y = _interpolate(self._prev_ball_y, self.ball_y, lag)
+        
+        powerup_rects = []
+        for powerup in self.powerups:
+            rect = powerup.rect.copy()
+            rect.y = _interpolate(powerup.prev_y, powerup.y, lag)
+            powerup_rects.append(rect)
+        return left_paddle, right_paddle, ball, powerup_rects
+    
+    def _moving_rects(
+        self, left_paddle: pygame.Rect, right_paddle: pygame.Rect, ball: pygame.Rect,
+        powerup_rects: List[pygame.Rect], texts: List[Tuple[pygame.Surface, Tuple[int, int]]]
+    ) -> List[pygame.Rect]:
+        """Get the screen areas of game elements that can change between frames, as drawn."""
+        # The fixed movers reuse their preallocated rects instead of building new ones
+        movers = self._mover_rects
+        left_area, right_area, ball_area, left_score, right_score, rally = movers
+        (left_text, left_pos), (right_text, right_pos), (label, label_pos), (value, value_pos) = texts
+        
+        left_area.update(left_paddle)
+        left_area.inflate_ip(4, 4)  # paddle plus its glow outline
+        right_area.update(right_paddle)
+        right_area.inflate_ip(4, 4)
+        ball_area.update(ball)
+        ball_area.inflate_ip(6, 6)  # ball plus its gold ring
+        left_score.update(left_pos, left_text.get_size())
+        right_score.update(right_pos, right_text.get_size())
+        rally.update(label_pos, label.get_size())
+        rally.union_ip((value_pos, value.get_size()))
+        
+        return movers + powerup_rects
+    
+    @staticmethod
+    def _merge_rects(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+        """Merge overlapping rects so every screen pixel is covered at most once."""
+        merged: List[pygame.Rect] = []
+        for rect in rects:
+            rect = rect.copy()
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+    
     def _draw_royal_background(self) -> None:
         """Draw an attractive royal gradient background."""
-        for y in range(GameConfig.WINDOW_HEIGHT):
-            # Create a royal purple to deep blue gradient
-            ratio = y / GameConfig.WINDOW_HEIGHT
-            r = int(75 + (65 - 75) * ratio)  # Deep purple to royal blue
-            g = int(0 + (105 - 0) * ratio)
-            b = int(130 + (225 - 130) * ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (GameConfig.WINDOW_WIDTH, y))
+        # Royal purple to deep blue gradient, pre-rendered in __init__
+        self.screen.blit(self._bg_start, (0, 0))
         
         # Add subtle animated stars/particles
-        star_positions = [
-            (50, 30), (150, 80), (300, 40), (500, 70), (700, 50),
-            (100, 450), (350, 420), (600, 460), (750, 440),
-            (200, 150), (650, 250), (400, 350),
-        ]
-        
-        for idx, (x, y) in enumerate(star_positions):
-            # Pulsing star effect
-            pulse = abs(((self.animation_counter + idx * 5) % 60) - 30) / 30.0
-            alpha_size = int(2 + pulse * 2)
+        for idx, (x, y) in enumerate(GameConfig.STAR_POSITIONS):
+            # Pulsing star effect, each star offset 5 frames into the cycle
+            alpha_size = GameConfig.STAR_SIZES[(self.animation_counter + idx * 5) & GameConfig.PULSE_MASK]
             pygame.draw.circle(self.screen, GameConfig.GOLD, (x, y), alpha_size)
     
     def _draw_royal_game_background(self) -> None:
         """Draw royal background for gameplay."""
-        for y in range(GameConfig.WINDOW_HEIGHT):
-            ratio = y / GameConfig.WINDOW_HEIGHT
-            r = int(75 + (30 - 75) * ratio)
-            g = int(0 + (50 - 0) * ratio)
-            b = int(130 + (150 - 130) * ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (GameConfig.WINDOW_WIDTH, y))
-    
-    def _draw_paddle(self, paddle: pygame.Rect, player: str) -> None:
+        self.screen.blit(self._bg_game, (0, 0))
+    
+    def _draw_paddle(self, paddle: pygame.Rect, player: Player) -> None:
         """Draw a paddle with optional glow effect."""
-        # Main paddle
-        pygame.draw.rect(self.screen, GameConfig.WHITE, paddle)
-        pygame.draw.rect(self.screen, GameConfig.CYAN, paddle, 2)
-        
-        # Draw glow if powered up
-        if player in self.active_powerups:
-            if PowerUpType.SLOW_AI in self.active_powerups[player]:
-                glow_color = GameConfig.CYAN
-            else:
-                glow_color = GameConfig.GREEN
-            
-            # Multiple layers for glow effect
-            pygame.draw.rect(self.screen, glow_color, paddle, 4)
-            pygame.draw.rect(self.screen, glow_color, (paddle.x - 2, paddle.y - 2, paddle.width + 4, paddle.height + 4), 1)
+        # Glow if powered up, in multiple layers pre-drawn with the paddle onto one sprite
+        timers = self.active_powerups[player]
+        glow_color = _PADDLE_GLOW_COLORS[timers[PowerUpType.SLOW_AI] > 0] if any(timers) else None
+        self.screen.blit(self._paddle_surface(paddle.height, glow_color), (paddle.x - 2, paddle.y - 2))
+    
+    def update_physics(self, keys: Sequence[bool]) -> None:
+        """Advance paddles, ball and power-ups by one fixed physics step."""
+        # The ball and power-ups record their own previous positions as they move
+        self._prev_left_y = self.left_paddle.y
+        self._prev_right_y = self.right_paddle.y
+        self.move_player(keys)
+        if self.is_two_player:
+            self.move_right_player(keys)
+        else:
+            self.move_ai()
+        self.update_ball()
+        self.spawn_powerup()
+        self.update_powerups()
     
     def update_display(self) -> None:
         """Update the game display."""
         if self.state == GameState.START_SCREEN:
             self.draw_start_screen()
+            pygame.display.update()
         elif self.state == GameState.GAME_OVER:
             self.draw_game_over()
+            pygame.display.update()
         else:
-            self.draw_game()
+            # Consecutive play frames only need the moving elements repainted
+            partial = self.state == GameState.PLAYING and self._last_drawn_state == GameState.PLAYING
+            self.draw_game(full_redraw=not partial)
+            
+            # A SCALED window presents the whole surface either way, so passing the
+            # dirty list to update() would only add per-rect overhead to flip()
+            pygame.display.flip()
         
-        pygame.display.update()
+        self._last_drawn_state = self.state
     
     def run(self) -> None:
-        """Main game loop."""
-        running = True
+        """
+        Main game loop.
         
-        while running:
-            running = self.handle_events()
-            
-            if self.state == GameState.PLAYING:
-                self.move_player()
-                if self.is_two_player:
-                    self.move_right_player()
+        Each frame blocks on frame pacing first, then polls input, simulates and
+        presents, so the input a frame acts on is as fresh as possible. Menus
+        block in SDL until input arrives or the next animation step is due
+        instead of pacing at full frame rate.
+        """
+        accumulator = 0.0
+        menu_timeout = 1000 // GameConfig.FPS
+        
+        # Hoist loop-invariant lookups into locals; the loop body runs every frame
+        fps = GameConfig.FPS
+        vsync_backstop_fps = 1000 // GameConfig.VSYNC_MIN_FRAME_MS
+        physics_step = GameConfig.PHYSICS_STEP
+        max_frame_time = GameConfig.MAX_FRAME_TIME
+        pulse_mask = GameConfig.PULSE_MASK
+        menu_states = (GameState.START_SCREEN, GameState.GAME_OVER)
+        playing = GameState.PLAYING
+        paused = GameState.PAUSED
+        tick = self.clock.tick
+        wait_event = pygame.event.wait
+        pump_events = pygame.event.pump
+        get_pressed = pygame.key.get_pressed
+        handle_events = self.handle_events
+        update_physics = self.update_physics
+        update_display = self.update_display
+        
+        while True:
+            if self.state in menu_states:
+                # Sleep until an event arrives or a frame's worth of time has passed
+                first_event = wait_event(menu_timeout)
+                frame_time = tick() / 1000.0
+            else:
+                first_event = None
+                if self._vsync and self.state == playing:
+                    # Every play frame presents and the present waits for vblank, so limiting
+                    # to FPS here as well would make presents miss vblanks. The cap sits well
+                    # above any real refresh rate and only bites if presents stop blocking
+                    # (e.g. a minimized window) or the startup probe was wrong
+                    frame_time = tick(vsync_backstop_fps) / 1000.0
                 else:
-                    self.move_ai()
-                self.update_ball()
-                self.spawn_powerup()
-                self.update_powerups()
+                    frame_time = tick(fps) / 1000.0
+                # Pump events once per rendered frame, right before simulating
+                pump_events()
+            
+            # Accumulate real elapsed time, clamped so a stall can't trigger a long catch-up burst
+            accumulator = min(accumulator + frame_time, max_frame_time)
+            
+            if not handle_events(first_event):
+                break
+            
+            # Snapshot keyboard state once per frame for both paddles
+            keys = get_pressed()
+            
+            # Advance the simulation in fixed steps, independent of draw cost; the state
+            # is re-read each step since a step can end the match
+            while accumulator >= physics_step:
+                state = self.state
+                if state == playing:
+                    update_physics(keys)
+                elif state != paused:
+                    # Menu stars and buttons pulse with the animation counter
+                    self._dirty = True
+                self.animation_counter = (self.animation_counter + 1) & pulse_mask
+                accumulator -= physics_step
+            
+            # Draw paddles, ball and power-ups part-way to the next step; frozen while paused
+            # so nothing shifts.
+            # Every play frame is presented: with whole-ms ticks, 60 Hz steps against a 60 Hz
+            # display often give 0 steps one frame and 2 the next, and skipping the 0-step
+            # present would make the following one miss its vblank
+            if self.state == playing:
+                self._render_alpha = accumulator / physics_step
+                self._dirty = True
             
-            self.animation_counter += 1
-            self.update_display()
-            self.clock.tick(GameConfig.FPS)
+            # Coalesce frames: present only when something visible has changed
+            if self._dirty:
+                self._dirty = False
+                update_display()
         
         pygame.quit()
         sys.exit()